@@ -1,19 +1,66 @@
 import sys
 import time
+_launch_time = time.perf_counter()  # Reference point for --benchmark-startup
 import serial
-import pandas as pd
-import numpy as np
-import openpyxl
-from openpyxl.styles import PatternFill
-from openpyxl.chart import LineChart, Reference
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTreeWidget, QTreeWidgetItem, 
                              QPushButton, QVBoxLayout, QHBoxLayout, QWidget, QLabel, 
                              QLineEdit, QMessageBox, QHeaderView, QSplitter, QCheckBox,
                              QStyleFactory, QComboBox, QFileDialog, QDateTimeEdit, 
                              QStatusBar, QListWidget, QTabWidget)
-from PyQt5.QtCore import QTimer, Qt, QSettings, QDateTime
+from PyQt5.QtCore import QTimer, Qt, QSettings, QDateTime, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QColor
-import pyqtgraph as pg
+
+# numpy, openpyxl and pyqtgraph are slow to import, so they are only imported
+# the first time the plot tab is opened or data is exported. --benchmark-startup
+# fails if any of these have been loaded by the time the window is shown.
+LAZY_MODULES = ("pandas", "numpy", "openpyxl", "pyqtgraph")
+
+# USB IDs reported by a Raspberry Pi Pico running MicroPython
+PICO_USB_VID = 0x2E8A
+PICO_USB_PID = 0x0005
+
+# How often the serial port list is re-scanned to pick up plugged/unplugged devices
+PORT_SCAN_INTERVAL_MS = 2000
+
+
+"""
+Background thread that watches the available serial ports.
+
+Emits ports_changed with a list of (device, description, vid, pid) tuples
+whenever a port is plugged in or removed.
+"""
+class PortScanner(QThread):
+    ports_changed = pyqtSignal(list)
+
+    def __init__(self, interval_ms=PORT_SCAN_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        # Scanning more often than this would keep the thread busy calling comports()
+        self.interval_ms = max(interval_ms, 100)
+
+    # Poll the serial ports until the thread is asked to stop
+    def run(self):
+        from serial.tools import list_ports
+
+        last_ports = None
+        while not self.isInterruptionRequested():
+            try:
+                ports = [(port.device, port.description, port.vid, port.pid)
+                         for port in sorted(list_ports.comports())]
+            except Exception as e:
+                print(f"Failed to list serial ports: {e}") # Debug message
+                ports = last_ports
+            if ports != last_ports:
+                self.ports_changed.emit(ports)
+                last_ports = ports
+
+            # Sleep in short slices so closing the window isn't held up by the scan interval
+            slept_ms = 0
+            while slept_ms < self.interval_ms:
+                if self.isInterruptionRequested():
+                    return
+                step_ms = min(100, self.interval_ms - slept_ms)
+                self.msleep(step_ms)
+                slept_ms += step_ms
 
 
 """
@@ -35,10 +82,12 @@ class MainWindow(QMainWindow):
         self.setup_ui()
         self.setup_serial_connection()
         self.setup_variables()
+        self.setup_port_scanner()
 
     # Load and apply application settings
     def setup_settings(self):
         self.settings = QSettings("Test", "SerialDataLogger")
+        self.save_settings_on_close = True
         self.move(self.settings.value("pos", self.pos()))
         self.resize(self.settings.value("size", self.size()))
 
@@ -107,8 +156,10 @@ class MainWindow(QMainWindow):
         com_label = QLabel("COM Port")
         com_label.setFont(QFont("Arial", 12, QFont.Bold))
         self.com_combo = QComboBox()
-        self.com_combo.addItems([f"COM{i}" for i in range(1, 21)])
-        self.com_combo.setCurrentText(self.settings.value("com_port", "COM10"))
+        self.com_combo.setPlaceholderText("Searching for ports...")
+        self.com_combo.activated.connect(self.select_com_port)
+        # Port the user last picked; reselected whenever it is plugged back in
+        self.preferred_com_port = self.settings.value("com_port", "")
         
         layout.addWidget(com_label)
         layout.addWidget(self.com_combo)
@@ -145,7 +196,8 @@ class MainWindow(QMainWindow):
         plot_tab = self.create_plot_tab()
         
         tab_widget.addTab(data_tab, "Data")
-        tab_widget.addTab(plot_tab, "Plot")
+        self.plot_tab_index = tab_widget.addTab(plot_tab, "Plot")
+        tab_widget.currentChanged.connect(self.on_tab_changed)
         
         return tab_widget
     
@@ -190,11 +242,24 @@ class MainWindow(QMainWindow):
         
         return data_widget
 
-    # Create and return the plot tab widget
+    # Create and return the plot tab widget. The plot itself is built on first view
     def create_plot_tab(self):
         plot_widget = QWidget()
-        plot_layout = QVBoxLayout(plot_widget)
+        self.plot_layout = QVBoxLayout(plot_widget)
+        self.plot = None
         
+        return plot_widget
+
+    # Build the plot the first time the plot tab is shown
+    def on_tab_changed(self, index):
+        if index == self.plot_tab_index and self.plot is None:
+            self.create_plot()
+            self.update_plot()
+
+    # Create the pyqtgraph plot widget inside the plot tab
+    def create_plot(self):
+        import pyqtgraph as pg
+
         self.plot = pg.PlotWidget()
         self.plot.setBackground('w')
         self.plot.setTitle("Real-time Voltage Plot")
@@ -205,9 +270,7 @@ class MainWindow(QMainWindow):
         self.plot.setMouseEnabled(x=True, y=True)
         self.plot.enableAutoRange()
         
-        plot_layout.addWidget(self.plot)
-        
-        return plot_widget
+        self.plot_layout.addWidget(self.plot)
 
     # Setup the serial connection parameters
     def setup_serial_connection(self):
@@ -226,11 +289,52 @@ class MainWindow(QMainWindow):
         self.plot_data = {}
         self.current_mux = 1
 
+    # Start watching for serial ports in the background
+    def setup_port_scanner(self):
+        self.port_scanner = PortScanner(parent=self)
+        self.port_scanner.ports_changed.connect(self.update_com_ports)
+        self.port_scanner.start()
+
+    # Refill the COM port list, preferring the user's choice, then a detected Pico, then the current port
+    def update_com_ports(self, ports):
+        current_port = self.com_combo.currentText()
+        pico_port = None
+
+        self.com_combo.clear()
+        for device, description, vid, pid in ports:
+            self.com_combo.addItem(device)
+            self.com_combo.setItemData(self.com_combo.count() - 1, description, Qt.ToolTipRole)
+            if pico_port is None and (vid, pid) == (PICO_USB_VID, PICO_USB_PID):
+                pico_port = device
+
+        devices = [device for device, _, _, _ in ports]
+        self.com_combo.setPlaceholderText("Select a port" if devices else "No serial ports found")
+        if self.preferred_com_port in devices:
+            self.com_combo.setCurrentText(self.preferred_com_port)
+        elif pico_port is not None:
+            # A detected Pico wins over any port that was picked automatically
+            if pico_port != current_port:
+                self.statusBar.showMessage(f"Raspberry Pi Pico detected on {pico_port}")
+            self.com_combo.setCurrentText(pico_port)
+        elif current_port in devices:
+            self.com_combo.setCurrentText(current_port)
+        elif devices:
+            # With a placeholder set, Qt leaves nothing selected after adding items
+            self.com_combo.setCurrentIndex(0)
+
+    # Remember the port the user picked from the list
+    def select_com_port(self, index):
+        self.preferred_com_port = self.com_combo.itemText(index)
+
     # Handles the window close event
     def closeEvent(self, event):
-        self.settings.setValue("pos", self.pos())
-        self.settings.setValue("size", self.size())
-        self.settings.setValue("com_port", self.com_combo.currentText())
+        if self.save_settings_on_close:
+            self.settings.setValue("pos", self.pos())
+            self.settings.setValue("size", self.size())
+            # Only remember a port the user picked, so an automatic pick can't outrank a Pico next time
+            self.settings.setValue("com_port", self.preferred_com_port)
+        self.port_scanner.requestInterruption()
+        self.port_scanner.wait()
         super().closeEvent(event)
 
     # Sets the threshold value for data filtering
@@ -380,6 +484,10 @@ class MainWindow(QMainWindow):
 
     # Update the plot with the latest data
     def update_plot(self):
+        if self.plot is None:
+            return
+        import numpy as np
+
         self.plot.clear()
         selected_mux = int(self.mux_combo.currentText().split()[1])
         selected_channels = [int(item.text().split()[1]) for item in self.channel_list.selectedItems()]
@@ -404,6 +512,9 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Data", "There is no data to export.")
             return
 
+        import openpyxl
+        from openpyxl.styles import PatternFill
+
         try:
             data = []
             for i in range(self.tree.topLevelItemCount()):
@@ -461,7 +572,8 @@ class MainWindow(QMainWindow):
     def clear_data(self):
         self.tree.clear()
         self.filter_checkbox.setChecked(False)
-        self.plot.clear()
+        if self.plot is not None:
+            self.plot.clear()
         self.plot_data = {}
         self.start_time = None
         
@@ -478,8 +590,23 @@ class MainWindow(QMainWindow):
             else:
                 item.setHidden(False)
 
+# Print how long it took from launch until the window was shown, then quit.
+# Exits with status 1 if a module that should be lazily imported was loaded at startup
+def report_startup_time(window):
+    elapsed_ms = (time.perf_counter() - _launch_time) * 1000
+    print(f"Startup time: {elapsed_ms:.1f} ms")
+    loaded_modules = [name for name in LAZY_MODULES if name in sys.modules]
+    if loaded_modules:
+        print(f"Imported at startup: {', '.join(loaded_modules)}")
+    # Don't let benchmark runs overwrite the operator's saved window and port settings
+    window.save_settings_on_close = False
+    window.close()
+    QApplication.exit(1 if loaded_modules else 0)
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    if "--benchmark-startup" in sys.argv:
+        QTimer.singleShot(0, lambda: report_startup_time(window))
+    sys.exit(app.exec_())
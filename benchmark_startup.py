@@ -0,0 +1,76 @@
+"""
+Measures how long applicationUpdated.py takes to start.
+
+Launches the application several times with --benchmark-startup and reports
+both the time until the window is shown (measured inside the application) and
+the total wall time of each run, including interpreter startup and shutdown.
+
+Exits with status 1 if the application imported pandas, numpy, openpyxl or
+pyqtgraph at startup, or if the median time until the window is shown is
+above --max-ms.
+
+Usage:
+    py benchmark_startup.py [runs] [--max-ms MS]
+
+On a machine without a display, set QT_QPA_PLATFORM=offscreen first.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "applicationUpdated.py")
+DEFAULT_RUNS = 10
+
+
+# Launch the application once and return (window shown ms, total wall ms).
+# Exits the benchmark if the application reported a failure
+def run_once():
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, APP_SCRIPT, "--benchmark-startup"],
+                            capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    match = re.search(r"Startup time: ([\d.]+) ms", result.stdout)
+    if result.returncode != 0 or match is None:
+        print(f"Startup check failed (exit status {result.returncode}):")
+        print(result.stdout + result.stderr)
+        sys.exit(1)
+    return float(match.group(1)), wall_ms
+
+
+# Run the benchmark, print a summary and fail if the startup time is over the limit
+def main():
+    parser = argparse.ArgumentParser(description="Measure applicationUpdated.py startup time.")
+    parser.add_argument("runs", type=int, nargs="?", default=DEFAULT_RUNS,
+                        help=f"number of timed launches (default {DEFAULT_RUNS})")
+    parser.add_argument("--max-ms", type=float,
+                        help="fail if the median time until the window is shown is above this")
+    args = parser.parse_args()
+
+    # The first launch warms the OS file cache, so it is not counted
+    run_once()
+
+    shown_times = []
+    wall_times = []
+    for _ in range(args.runs):
+        shown_ms, wall_ms = run_once()
+        shown_times.append(shown_ms)
+        wall_times.append(wall_ms)
+
+    median_shown = statistics.median(shown_times)
+    print(f"Runs: {args.runs}")
+    print(f"Window shown: median {median_shown:.1f} ms, min {min(shown_times):.1f} ms")
+    print(f"Total run:    median {statistics.median(wall_times):.1f} ms, min {min(wall_times):.1f} ms")
+
+    if args.max_ms is not None and median_shown > args.max_ms:
+        print(f"Startup regression: median {median_shown:.1f} ms is above the {args.max_ms:.1f} ms limit")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()